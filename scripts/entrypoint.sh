@@ -29,6 +29,10 @@ if [ -e "$SOCKET_FILE" ]; then
     rm -f "$SOCKET_FILE"
 fi
 
+# Prepare the Chrome profile base on tmpfs (recreated on every container start)
+CHROME_USER_DATA_BASE=${HFC_CHROME_USER_DATA_BASE:-/dev/shm/chrome-profiles}
+mkdir -p "$CHROME_USER_DATA_BASE"
+
 # Start Xvfb with the configured display
 echo "Starting Xvfb on display ${DISPLAY} with resolution ${DISPLAY_WIDTH}x${DISPLAY_HEIGHT}x${DISPLAY_DEPTH}..."
 Xvfb ${DISPLAY} -screen 0 ${DISPLAY_WIDTH}x${DISPLAY_HEIGHT}x${DISPLAY_DEPTH} -ac &
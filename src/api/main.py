@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api.routes import router
 from src.utils.logging import AccessLogMiddleware, get_logger, setup_logging
@@ -20,6 +21,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting Headfull Chrome API", version="0.1.0")
 
     # Import here to avoid circular imports
+    from src.browser.cdp import close_http_client
     from src.browser.manager import browser_manager
     from src.jobs.queue import job_queue
 
@@ -37,6 +39,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Shutting down...")
     await job_queue.stop()
     await browser_manager.cleanup()
+    await close_http_client()
     logger.info("Shutdown complete")
 
 
@@ -45,6 +48,9 @@ app = FastAPI(
     description="Browser automation API with real display via Xvfb",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson encodes large payloads (page HTML in job results) far faster
+    # than stdlib json and produces bytes directly
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
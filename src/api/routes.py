@@ -1,13 +1,30 @@
 """API route definitions."""
 
+import asyncio
+from collections import OrderedDict
+
 from fastapi import APIRouter, HTTPException, status
 
-from src.models import ContentRequest, ContentResponse, JobResponse
+from src.config import settings
+from src.models import (
+    ContentRequest,
+    ContentResponse,
+    JobResponse,
+    JobStatus,
+    PageJob,
+    SessionStatus,
+)
 from src.utils.logging import get_logger
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Completed/failed jobs never change again, so their responses can be
+# memoized for the typical poll-until-done client pattern
+_TERMINAL_STATUSES = {JobStatus.COMPLETED, JobStatus.FAILED}
+_COMPLETED_CACHE_MAX = 10_000
+_completed_cache: OrderedDict[str, JobResponse] = OrderedDict()
+
 
 @router.post(
     "/contents",
@@ -26,34 +43,46 @@ async def create_contents(requests: list[ContentRequest]) -> list[ContentRespons
     """
     from src.jobs.queue import job_queue
 
-    responses = []
+    semaphore = asyncio.Semaphore(settings.max_concurrent_sessions)
 
-    for request in requests:
-        logger.info(
-            "Creating content session",
-            pages_count=len(request.pages),
-            proxy=request.config.proxy_server,
-        )
+    async def _create_one(request: ContentRequest) -> ContentResponse:
+        async with semaphore:
+            logger.info(
+                "Creating content session",
+                pages_count=len(request.pages),
+                proxy=request.config.proxy_server,
+            )
 
-        try:
             session = await job_queue.create_session(
                 pages=request.pages,
                 config=request.config,
             )
 
+            return ContentResponse(
+                id=session.id,
+                status=session.status,
+                pages=[
+                    PageJob.model_construct(url=url, id=job_id) for url, job_id in session.pages
+                ],
+            )
+
+    # Create sessions concurrently; one bad request must not poison the batch
+    results = await asyncio.gather(
+        *(_create_one(request) for request in requests),
+        return_exceptions=True,
+    )
+
+    # Map failures to per-entry error markers: the successful entries have
+    # already been queued, so their IDs must reach the client either way
+    responses: list[ContentResponse] = []
+    for i, result in enumerate(results):
+        if isinstance(result, BaseException):
+            logger.error("Failed to create session", index=i, error=str(result))
             responses.append(
-                ContentResponse(
-                    id=session.id,
-                    status=session.status,
-                    pages=session.pages,
-                )
+                ContentResponse(id="", status=SessionStatus.FAILED, pages=[], error=str(result))
             )
-        except Exception as e:
-            logger.error("Failed to create session", error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to create session: {str(e)}",
-            ) from e
+        else:
+            responses.append(result)
 
     return responses
 
@@ -72,6 +101,11 @@ async def get_job(job_id: str) -> JobResponse:
     """
     from src.jobs.store import job_store
 
+    cached = _completed_cache.get(job_id)
+    if cached is not None:
+        _completed_cache.move_to_end(job_id)
+        return cached
+
     job = job_store.get(job_id)
 
     if job is None:
@@ -80,7 +114,7 @@ async def get_job(job_id: str) -> JobResponse:
             detail=f"Job not found: {job_id}",
         )
 
-    return JobResponse(
+    response = JobResponse(
         id=job.id,
         status=job.status,
         execution_time_ms=job.execution_time_ms,
@@ -89,3 +123,11 @@ async def get_job(job_id: str) -> JobResponse:
         completed_at=job.completed_at,
         result=job.result,
     )
+
+    # Only terminal jobs are cached so live status updates stay visible
+    if job.status in _TERMINAL_STATUSES:
+        _completed_cache[job_id] = response
+        if len(_completed_cache) > _COMPLETED_CACHE_MAX:
+            _completed_cache.popitem(last=False)
+
+    return response
@@ -1,17 +1,40 @@
 """Chrome DevTools Protocol (CDP) client."""
 
 import asyncio
-import json
 from typing import Any
 
 import httpx
+import orjson
 import websockets
-from websockets import ClientConnection
+from websockets.asyncio.client import ClientConnection
+from websockets.asyncio.client import connect as ws_connect
 
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Shared keep-alive HTTP client for localhost DevTools endpoints
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it lazily."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=64),
+            timeout=httpx.Timeout(5.0),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class CDPError(Exception):
     """CDP protocol error."""
@@ -28,6 +51,13 @@ class CDPClient:
         self._message_id = 0
         self._pending_responses: dict[int, asyncio.Future[Any]] = {}
         self._receive_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._session_id: str | None = None
+        self._target_id: str | None = None
+        self._event_waiters: dict[tuple[str | None, str], list[asyncio.Future[dict[str, Any]]]] = {}
+        self._load_event = asyncio.Event()
+        self._page_events_enabled = False
+        self._root_node_id: int | None = None
 
     @property
     def base_url(self) -> str:
@@ -36,51 +66,67 @@ class CDPClient:
 
     async def connect(self, timeout: float = 10.0) -> None:
         """
-        Connect to Chrome DevTools page target.
+        Connect to the browser-level DevTools endpoint and attach to a page.
+
+        One browser WebSocket multiplexes any number of page targets via flat
+        session routing (Target.attachToTarget with flatten), so additional
+        tabs cost a sessionId instead of a dedicated connection.
 
         Args:
             timeout: Connection timeout in seconds
         """
         ws_url = None
+        self._loop = asyncio.get_running_loop()
+        client = get_http_client()
 
-        async with httpx.AsyncClient() as client:
-            for _attempt in range(int(timeout)):
-                try:
-                    # Get list of targets (pages)
-                    response = await client.get(f"{self.base_url}/json/list")
-                    if response.status_code == 200:
-                        targets = response.json()
-                        # Find a page target
-                        for target in targets:
-                            if target.get("type") == "page":
-                                ws_url = target.get("webSocketDebuggerUrl")
-                                if ws_url:
-                                    break
-                        if ws_url:
-                            break
-
-                    # If no page target found, try to create one or wait
-                    if not ws_url:
-                        # Check if browser endpoint exists at least
-                        version_resp = await client.get(f"{self.base_url}/json/version")
-                        if version_resp.status_code == 200:
-                            logger.debug("Browser connected but no page target yet, waiting...")
-
-                except httpx.ConnectError:
-                    pass
-                await asyncio.sleep(1)
-            else:
-                raise CDPError(f"Failed to connect to DevTools page after {timeout}s")
-
-        logger.debug("Connecting to page WebSocket", url=ws_url)
-
-        # Connect to WebSocket
-        self._ws = await websockets.connect(ws_url, max_size=100 * 1024 * 1024)
+        for _attempt in range(int(timeout)):
+            try:
+                # The browser endpoint exposes one WebSocket for all targets
+                response = await client.get(f"{self.base_url}/json/version")
+                if response.status_code == 200:
+                    ws_url = response.json().get("webSocketDebuggerUrl")
+                    if ws_url:
+                        break
+            except httpx.ConnectError:
+                pass
+            await asyncio.sleep(1)
+        else:
+            raise CDPError(f"Failed to connect to DevTools browser endpoint after {timeout}s")
+
+        logger.debug("Connecting to browser WebSocket", url=ws_url)
+
+        # Connect to WebSocket. Compression burns CPU inflating every CDP
+        # frame for little gain on localhost, and pings are pointless there;
+        # a larger write buffer helps the bursty send_many batches.
+        self._ws = await ws_connect(
+            ws_url,
+            max_size=100 * 1024 * 1024,
+            compression=None,
+            ping_interval=None,
+            write_limit=2**20,
+        )
 
         # Start message receiver
         self._receive_task = asyncio.create_task(self._receive_messages())
 
-        logger.info("CDP connected", port=self.devtools_port)
+        # Attach to the initial page target (create one if the browser has none)
+        targets = await self.send("Target.getTargets", session_id="")
+        target_id = None
+        for info in targets.get("targetInfos", []):
+            if info.get("type") == "page":
+                target_id = info["targetId"]
+                break
+        if target_id is None:
+            created = await self.send("Target.createTarget", {"url": "about:blank"}, session_id="")
+            target_id = created["targetId"]
+
+        attached = await self.send(
+            "Target.attachToTarget", {"targetId": target_id, "flatten": True}, session_id=""
+        )
+        self._target_id = target_id
+        self._session_id = attached["sessionId"]
+
+        logger.info("CDP connected", port=self.devtools_port, session_id=self._session_id)
 
     async def disconnect(self) -> None:
         """Disconnect from Chrome DevTools."""
@@ -96,51 +142,110 @@ class CDPClient:
             await self._ws.close()
             self._ws = None
 
+        self._session_id = None
+        self._target_id = None
+
         logger.debug("CDP disconnected")
 
     async def _receive_messages(self) -> None:
         """Background task to receive WebSocket messages."""
-        if not self._ws:
+        ws = self._ws
+        if not ws:
             return
 
+        # Bind the hot lookups once; the loop runs for every CDP frame
+        loads = orjson.loads
+        pending_pop = self._pending_responses.pop
+        dispatch_event = self._dispatch_event
+
         try:
-            async for message in self._ws:
-                data = json.loads(message)
+            async for message in ws:
+                data = loads(message)
 
                 # Handle response to our command
-                if "id" in data:
-                    msg_id = data["id"]
-                    if msg_id in self._pending_responses:
-                        future = self._pending_responses.pop(msg_id)
-                        if "error" in data:
-                            error_msg = data["error"].get("message", "Unknown error")
-                            future.set_exception(CDPError(error_msg))
-                        else:
-                            future.set_result(data.get("result", {}))
-
-                # Handle events (optional, for future use)
-                elif "method" in data:
-                    logger.debug("CDP event", method=data["method"])
+                msg_id = data.get("id")
+                if msg_id is not None:
+                    future = pending_pop(msg_id, None)
+                    if future is None or future.done():
+                        continue
+                    error = data.get("error")
+                    if error is not None:
+                        future.set_exception(CDPError(error.get("message", "Unknown error")))
+                    else:
+                        future.set_result(data.get("result", {}))
+
+                # Handle events, routed by the session they came from
+                else:
+                    method = data.get("method")
+                    if method is not None:
+                        dispatch_event(method, data.get("params", {}), data.get("sessionId"))
 
         except websockets.ConnectionClosed:
             logger.debug("WebSocket connection closed")
         except Exception as e:
             logger.error("Error receiving CDP messages", error=str(e))
 
-    async def send(self, method: str, params: dict[str, Any] | None = None) -> Any:
+    def _dispatch_event(
+        self, method: str, params: dict[str, Any], session_id: str | None = None
+    ) -> None:
+        """Resolve waiters subscribed to a CDP event."""
+        if method == "Page.loadEventFired" and session_id == self._session_id:
+            self._load_event.set()
+
+        waiters = self._event_waiters.pop((session_id, method), None)
+        if waiters:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(params)
+        else:
+            logger.debug("CDP event", method=method)
+
+    async def wait_for_event(
+        self, method: str, timeout: float = 30.0, session_id: str | None = None
+    ) -> dict[str, Any]:
         """
-        Send a CDP command and wait for response.
+        Wait for a CDP event to fire.
 
         Args:
-            method: CDP method name (e.g., "Page.navigate")
-            params: Method parameters
+            method: CDP event name (e.g., "Page.loadEventFired")
+            timeout: Maximum wait time in seconds
+            session_id: Target session the event belongs to (defaults to the
+                client's primary page session)
 
         Returns:
-            Command result
+            Event parameters
         """
-        if not self._ws:
-            raise CDPError("Not connected to DevTools")
+        if session_id is None:
+            session_id = self._session_id
+
+        loop = self._loop or asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        key = (session_id, method)
+        self._event_waiters.setdefault(key, []).append(future)
 
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except TimeoutError as e:
+            waiters = self._event_waiters.get(key)
+            if waiters and future in waiters:
+                waiters.remove(future)
+            raise CDPError(f"Timeout waiting for event {method}") from e
+
+    async def enable_page_events(self) -> None:
+        """Enable Page domain events (idempotent)."""
+        if not self._page_events_enabled:
+            await self.send("Page.enable")
+            self._page_events_enabled = True
+
+    def _queue_command(
+        self, method: str, params: dict[str, Any] | None, session_id: str | None = None
+    ) -> tuple[int, asyncio.Future[Any], str]:
+        """
+        Allocate a message id, register a response future and build the frame.
+
+        session_id None routes to the client's primary page session; an empty
+        string addresses the browser target itself (e.g. Target.* commands).
+        """
         self._message_id += 1
         msg_id = self._message_id
 
@@ -150,21 +255,120 @@ class CDPClient:
             "params": params or {},
         }
 
-        # Create future for response
+        if session_id is None:
+            session_id = self._session_id
+        if session_id:
+            message["sessionId"] = session_id
+
         future: asyncio.Future[Any] = asyncio.Future()
         self._pending_responses[msg_id] = future
 
+        # DevTools only accepts text frames, so decode the orjson bytes
+        return msg_id, future, orjson.dumps(message).decode()
+
+    def _arm_deadline(
+        self,
+        entries: list[tuple[int, asyncio.Future[Any], str]],
+        timeout: float,
+    ) -> None:
+        """
+        Expire a batch of pending commands with a single call_later timer.
+
+        One shared timer replaces a per-command asyncio.wait_for, which would
+        push one TimerHandle onto the loop's scheduler heap per in-flight
+        command; the timer is cancelled once every response has arrived.
+        """
+        loop = self._loop or asyncio.get_running_loop()
+
+        def _expire() -> None:
+            for msg_id, future, method in entries:
+                self._pending_responses.pop(msg_id, None)
+                if not future.done():
+                    future.set_exception(CDPError(f"Timeout waiting for response to {method}"))
+
+        handle = loop.call_later(timeout, _expire)
+        remaining = len(entries)
+
+        def _on_done(_future: asyncio.Future[Any]) -> None:
+            nonlocal remaining
+            remaining -= 1
+            if remaining == 0:
+                handle.cancel()
+
+        for _msg_id, future, _method in entries:
+            future.add_done_callback(_on_done)
+
+    async def send_many(
+        self,
+        commands: list[tuple[str, dict[str, Any] | None]],
+        timeout: float = 30.0,
+        session_id: str | None = None,
+    ) -> list[asyncio.Future[Any]]:
+        """
+        Send several CDP commands back-to-back without awaiting responses in between.
+
+        Independent commands share one round-trip on the critical path instead
+        of one per command; responses arrive via the returned futures. The
+        whole batch shares a single response deadline.
+
+        Args:
+            commands: List of (method, params) tuples
+            timeout: Response deadline for the batch in seconds
+            session_id: Target session for the batch (defaults to the
+                client's primary page session)
+
+        Returns:
+            One response future per command, in order
+        """
+        if not self._ws:
+            raise CDPError("Not connected to DevTools")
+
+        entries: list[tuple[int, asyncio.Future[Any], str]] = []
+        frames: list[str] = []
+        for method, params in commands:
+            msg_id, future, frame = self._queue_command(method, params, session_id)
+            entries.append((msg_id, future, method))
+            frames.append(frame)
+
+        self._arm_deadline(entries, timeout)
+
+        for frame in frames:
+            await self._ws.send(frame)
+        logger.debug("CDP batch sent", count=len(frames))
+
+        return [future for _msg_id, future, _method in entries]
+
+    async def send(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        timeout: float = 30.0,
+        session_id: str | None = None,
+    ) -> Any:
+        """
+        Send a CDP command and wait for response.
+
+        Args:
+            method: CDP method name (e.g., "Page.navigate")
+            params: Method parameters
+            timeout: Response deadline in seconds
+            session_id: Target session (defaults to the client's primary page
+                session; pass "" for browser-level commands)
+
+        Returns:
+            Command result
+        """
+        if not self._ws:
+            raise CDPError("Not connected to DevTools")
+
+        msg_id, future, frame = self._queue_command(method, params, session_id)
+        self._arm_deadline([(msg_id, future, method)], timeout)
+
         # Send message
-        await self._ws.send(json.dumps(message))
+        await self._ws.send(frame)
         logger.debug("CDP command sent", method=method, id=msg_id)
 
-        # Wait for response
-        try:
-            result = await asyncio.wait_for(future, timeout=30.0)
-            return result
-        except TimeoutError as e:
-            self._pending_responses.pop(msg_id, None)
-            raise CDPError(f"Timeout waiting for response to {method}") from e
+        return await future
 
     async def navigate(self, url: str) -> dict[str, Any]:
         """
@@ -177,36 +381,35 @@ class CDPClient:
             Navigation result
         """
         logger.info("Navigating to URL", url=url)
-        result: dict[str, Any] = await self.send("Page.navigate", {"url": url})
+
+        self._load_event.clear()
+        self._root_node_id = None
+
+        if not self._page_events_enabled:
+            # Pipeline Page.enable with the navigation; enabling events before
+            # the navigate frame guarantees the load event is not missed.
+            enable_future, navigate_future = await self.send_many(
+                [("Page.enable", None), ("Page.navigate", {"url": url})]
+            )
+            self._page_events_enabled = True
+            await enable_future
+            result: dict[str, Any] = await navigate_future
+        else:
+            result = await self.send("Page.navigate", {"url": url})
+
         return result
 
     async def wait_for_load(self, timeout: float = 30.0) -> None:
         """
-        Wait for page to finish loading.
+        Wait for the Page.loadEventFired event after navigation.
 
         Args:
             timeout: Maximum wait time in seconds
         """
-        # Enable Page events
-        await self.send("Page.enable")
-
-        # Wait for load event using simple polling approach
-        start_time = asyncio.get_event_loop().time()
-
-        while True:
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                raise CDPError("Timeout waiting for page load")
-
-            try:
-                # Check document ready state
-                result = await self.send("Runtime.evaluate", {"expression": "document.readyState"})
-                state = result.get("result", {}).get("value", "")
-                if state == "complete":
-                    break
-            except CDPError:
-                pass
-
-            await asyncio.sleep(0.5)
+        try:
+            await asyncio.wait_for(self._load_event.wait(), timeout=timeout)
+        except TimeoutError as e:
+            raise CDPError("Timeout waiting for page load") from e
 
         logger.debug("Page loaded")
 
@@ -214,26 +417,35 @@ class CDPClient:
         """
         Get page HTML content.
 
+        Uses DOM.getOuterHTML instead of evaluating JavaScript, which avoids
+        serializing the whole document into a V8 string first.
+
         Returns:
             HTML content of the page
         """
-        result = await self.send(
-            "Runtime.evaluate", {"expression": "document.documentElement.outerHTML"}
-        )
-        content: str = result.get("result", {}).get("value", "")
+        if self._root_node_id is None:
+            root = await self.send("DOM.getDocument", {"depth": 0})
+            self._root_node_id = root.get("root", {}).get("nodeId")
+
+        result = await self.send("DOM.getOuterHTML", {"nodeId": self._root_node_id})
+        content: str = result.get("outerHTML", "")
         logger.debug("Got page content", length=len(content))
         return content
 
     async def get_title(self) -> str:
         """Get page title."""
-        result = await self.send("Runtime.evaluate", {"expression": "document.title"})
-        title: str = result.get("result", {}).get("value", "")
+        result = await self.send("Target.getTargetInfo")
+        title: str = result.get("targetInfo", {}).get("title", "")
         return title
 
     async def screenshot(self, format: str = "png", quality: int = 80) -> bytes:
         """
         Take a screenshot of the page.
 
+        The capture is returned as an IO stream and read in chunks, which
+        avoids embedding the whole image base64-encoded in a single CDP
+        response and decoding it in one full-buffer pass.
+
         Args:
             format: Image format ("png" or "jpeg")
             quality: JPEG quality (0-100)
@@ -243,13 +455,29 @@ class CDPClient:
         """
         import base64
 
-        params: dict[str, Any] = {"format": format}
+        params: dict[str, Any] = {"format": format, "transferMode": "ReturnAsStream"}
         if format == "jpeg":
             params["quality"] = quality
 
         result = await self.send("Page.captureScreenshot", params)
-        data = result.get("data", "")
-        return base64.b64decode(data)
+        stream_handle = result["stream"]
+
+        buffer = bytearray()
+        try:
+            while True:
+                chunk = await self.send("IO.read", {"handle": stream_handle, "size": 65536})
+                data = chunk.get("data", "")
+                if data:
+                    if chunk.get("base64Encoded"):
+                        buffer += base64.b64decode(data)
+                    else:
+                        buffer += data.encode()
+                if chunk.get("eof"):
+                    break
+        finally:
+            await self.send("IO.close", {"handle": stream_handle})
+
+        return bytes(buffer)
 
     async def create_new_target(self, url: str = "about:blank") -> str:
         """
@@ -261,7 +489,28 @@ class CDPClient:
         Returns:
             Target ID
         """
-        result = await self.send("Target.createTarget", {"url": url})
+        result = await self.send("Target.createTarget", {"url": url}, session_id="")
         target_id: str = result.get("targetId", "")
         logger.debug("Created new target", target_id=target_id)
         return target_id
+
+    async def attach_to_new_target(self, url: str = "about:blank") -> str:
+        """
+        Open an additional page target and attach to it on this connection.
+
+        Commands for the new page are routed by passing the returned session
+        id to send/send_many, so N tabs share one WebSocket and one Chrome.
+
+        Args:
+            url: Initial URL for the new tab
+
+        Returns:
+            Session ID for the attached target
+        """
+        target_id = await self.create_new_target(url)
+        attached = await self.send(
+            "Target.attachToTarget", {"targetId": target_id, "flatten": True}, session_id=""
+        )
+        session_id: str = attached["sessionId"]
+        logger.debug("Attached to new target", target_id=target_id, session_id=session_id)
+        return session_id
@@ -1,11 +1,16 @@
 """Chrome process management."""
 
 import asyncio
+import functools
 import os
 import shutil
 import tempfile
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 
+import httpx
+
+from src.browser.cdp import get_http_client
 from src.config import settings
 from src.utils.logging import get_logger
 
@@ -20,14 +25,62 @@ class ChromeProcess:
     display_num: int
     devtools_port: int
     user_data_dir: str
+    process: asyncio.subprocess.Process = field(repr=False)
     ws_url: str | None = None
 
 
 class ChromeLauncher:
     """Manages Chrome process lifecycle."""
 
+    # Flags that never vary between launches; the per-launch values
+    # (binary, port, user data dir, window size, proxy) are appended
+    # in _build_chrome_args
+    _STATIC_ARGS: tuple[str, ...] = (
+        "--start-maximized",
+        # Disable features that interfere with automation
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-background-networking",
+        "--disable-client-side-phishing-detection",
+        "--disable-default-apps",
+        "--disable-extensions",
+        "--disable-hang-monitor",
+        "--disable-popup-blocking",
+        "--disable-prompt-on-repost",
+        "--disable-sync",
+        "--disable-translate",
+        "--metrics-recording-only",
+        "--safebrowsing-disable-auto-update",
+        # Performance
+        "--disable-dev-shm-usage",
+        # Caches have no reuse value for ephemeral scraping sessions;
+        # keep what little remains in RAM and discard it aggressively
+        "--disk-cache-dir=/dev/shm/chrome_cache",
+        "--disk-cache-size=1",
+        "--media-cache-size=1",
+        "--aggressive-cache-discard",
+        # Rendering: ANGLE-on-SwiftShader raster instead of the slow
+        # disable-gpu fallback path (no real GPU under Xvfb)
+        "--use-gl=angle",
+        "--use-angle=swiftshader",
+        "--enable-gpu-rasterization",
+        "--enable-zero-copy",
+        "--ignore-gpu-blocklist",
+        "--disable-features=Translate,BackForwardCache,OptimizationHints,MediaRouter",
+        # Keep the tab foregrounded for CDP
+        "--disable-background-timer-throttling",
+        "--disable-renderer-backgrounding",
+        # Accept language
+        "--lang=en-US",
+    )
+
     def __init__(self) -> None:
         self._processes: dict[str, ChromeProcess] = {}
+        self._idle: asyncio.Queue[ChromeProcess] = asyncio.Queue()
+        self._prewarm_counter = 0
+        # Settings are stable for the process lifetime, so the window-size
+        # flag can be formatted once up front
+        self._window_size_arg = f"--window-size={settings.display_width},{settings.display_height}"
 
     def _build_chrome_args(
         self,
@@ -41,30 +94,8 @@ class ChromeLauncher:
             settings.chrome_binary,
             f"--remote-debugging-port={devtools_port}",
             f"--user-data-dir={user_data_dir}",
-            # Window settings
-            f"--window-size={settings.display_width},{settings.display_height}",
-            "--start-maximized",
-            # Disable features that interfere with automation
-            "--no-first-run",
-            "--no-default-browser-check",
-            "--disable-background-networking",
-            "--disable-client-side-phishing-detection",
-            "--disable-default-apps",
-            "--disable-extensions",
-            "--disable-hang-monitor",
-            "--disable-popup-blocking",
-            "--disable-prompt-on-repost",
-            "--disable-sync",
-            "--disable-translate",
-            "--metrics-recording-only",
-            "--safebrowsing-disable-auto-update",
-            # Performance
-            "--disable-dev-shm-usage",
-            "--disable-gpu",
-            # Don't run headless - we want real rendering
-            "--disable-software-rasterizer",
-            # Accept language
-            "--lang=en-US",
+            self._window_size_arg,
+            *self._STATIC_ARGS,
         ]
 
         if proxy_server:
@@ -81,7 +112,7 @@ class ChromeLauncher:
         proxy_server: str | None = None,
     ) -> ChromeProcess:
         """
-        Launch a new Chrome process.
+        Launch a new Chrome process for a session.
 
         Args:
             session_id: Unique session identifier
@@ -92,9 +123,26 @@ class ChromeLauncher:
         Returns:
             ChromeProcess instance with process details
         """
+        chrome_process = await self._launch_process(
+            name=session_id,
+            display_num=display_num,
+            devtools_port=devtools_port,
+            proxy_server=proxy_server,
+        )
+        self._processes[session_id] = chrome_process
+        return chrome_process
+
+    async def _launch_process(
+        self,
+        name: str,
+        display_num: int,
+        devtools_port: int,
+        proxy_server: str | None = None,
+    ) -> ChromeProcess:
+        """Spawn a Chrome process without registering it to a session."""
         # Create temporary user data directory
         user_data_dir = tempfile.mkdtemp(
-            prefix=f"chrome_{session_id}_",
+            prefix=f"chrome_{name}_",
             dir=settings.chrome_user_data_base,
         )
 
@@ -111,12 +159,13 @@ class ChromeLauncher:
 
         logger.info(
             "Launching Chrome",
-            session_id=session_id,
+            name=name,
             display=display_num,
             devtools_port=devtools_port,
             user_data_dir=user_data_dir,
         )
 
+        process: asyncio.subprocess.Process | None = None
         try:
             process = await asyncio.create_subprocess_exec(
                 *args,
@@ -125,39 +174,201 @@ class ChromeLauncher:
                 stderr=asyncio.subprocess.PIPE,
             )
 
-            # Wait a bit for Chrome to start and open the DevTools port
-            await asyncio.sleep(2)
-
-            # Check if process is still running
-            if process.returncode is not None:
-                stderr = await process.stderr.read() if process.stderr else b""
-                raise RuntimeError(
-                    f"Chrome failed to start: exit code {process.returncode}, "
-                    f"stderr: {stderr.decode()}"
-                )
+            # Wait until the DevTools endpoint answers instead of a fixed sleep
+            await self._wait_devtools_ready(process, devtools_port)
 
             chrome_process = ChromeProcess(
                 pid=process.pid,
                 display_num=display_num,
                 devtools_port=devtools_port,
                 user_data_dir=user_data_dir,
+                process=process,
             )
 
-            self._processes[session_id] = chrome_process
-
             logger.info(
                 "Chrome launched successfully",
-                session_id=session_id,
+                name=name,
                 pid=process.pid,
             )
 
             return chrome_process
 
         except Exception as e:
-            # Cleanup on failure
+            # Cleanup on failure; a Chrome that spawned but never became
+            # ready must be killed here, or it would keep squatting on the
+            # DevTools port after the caller recycles it
+            if process is not None and process.returncode is None:
+                try:
+                    process.kill()
+                    await process.wait()
+                except ProcessLookupError:
+                    pass
             shutil.rmtree(user_data_dir, ignore_errors=True)
             raise RuntimeError(f"Failed to launch Chrome: {e}") from e
 
+    async def _wait_devtools_ready(
+        self,
+        process: asyncio.subprocess.Process,
+        devtools_port: int,
+        timeout: float = 5.0,
+    ) -> None:
+        """
+        Poll the DevTools /json/version endpoint until Chrome answers.
+
+        Chrome is typically ready in 200-500ms; probing instead of sleeping
+        a fixed interval reclaims the difference on every launch.
+
+        Args:
+            process: The just-spawned Chrome process
+            devtools_port: Port for DevTools protocol
+            timeout: Hard ceiling on the wait in seconds
+        """
+        # Pure duration check, so time.monotonic beats going through the loop
+        deadline = time.monotonic() + timeout
+        url = f"http://localhost:{devtools_port}/json/version"
+        client = get_http_client()
+
+        while True:
+            if process.returncode is not None:
+                stderr = await process.stderr.read() if process.stderr else b""
+                raise RuntimeError(
+                    f"Chrome failed to start: exit code {process.returncode}, "
+                    f"stderr: {stderr.decode()}"
+                )
+
+            try:
+                response = await client.get(url, timeout=0.2)
+                if response.status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Chrome DevTools not ready after {timeout}s")
+
+            await asyncio.sleep(0.05)
+
+    async def prewarm(self, count: int) -> None:
+        """
+        Pre-launch idle Chrome processes so sessions skip the cold start.
+
+        Each pooled process holds a DevTools port from the port pool for as
+        long as it stays warm. Launch failures stop pre-warming early (e.g.
+        no Chrome binary in a dev environment) without failing startup.
+
+        Args:
+            count: Number of Chrome processes to pre-launch
+        """
+        from src.browser.resource_pool import port_pool
+
+        display = os.environ.get("DISPLAY", ":99")
+        display_num = int(display.lstrip(":"))
+
+        for _ in range(count):
+            port = await port_pool.acquire()
+            if port is None:
+                break
+
+            self._prewarm_counter += 1
+            try:
+                chrome_process = await self._launch_process(
+                    name=f"pool{self._prewarm_counter}",
+                    display_num=display_num,
+                    devtools_port=port,
+                )
+            except Exception as e:
+                await port_pool.release(port)
+                logger.warning("Chrome pre-warm stopped", error=str(e), warmed=self.idle_count)
+                break
+
+            self._idle.put_nowait(chrome_process)
+
+        logger.info("Chrome pool pre-warmed", warmed=self.idle_count)
+
+    async def acquire_pooled(self, session_id: str) -> ChromeProcess | None:
+        """
+        Take a pre-warmed Chrome process from the idle pool, if any.
+
+        Args:
+            session_id: Session identifier to register the process under
+
+        Returns:
+            A live, warm ChromeProcess, or None if the pool is empty
+        """
+        from src.browser.resource_pool import port_pool
+
+        while True:
+            try:
+                chrome_process = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+
+            # A pooled Chrome can die while idle; only hand out live
+            # processes so the caller never burns its connect retries on a
+            # corpse
+            if chrome_process.process.returncode is None:
+                break
+
+            logger.warning(
+                "Discarding dead pooled Chrome",
+                pid=chrome_process.pid,
+                port=chrome_process.devtools_port,
+            )
+            await self._terminate_process(chrome_process)
+            await port_pool.release(chrome_process.devtools_port)
+
+        self._processes[session_id] = chrome_process
+        logger.debug(
+            "Acquired pooled Chrome",
+            session_id=session_id,
+            pid=chrome_process.pid,
+            idle=self.idle_count,
+        )
+        return chrome_process
+
+    def release_to_pool(self, session_id: str) -> None:
+        """
+        Return a session's Chrome process to the idle pool instead of killing it.
+
+        The caller is responsible for resetting browser state (navigation,
+        cookies) before releasing.
+
+        Args:
+            session_id: Session identifier
+        """
+        chrome_process = self._processes.pop(session_id, None)
+
+        if chrome_process is None:
+            logger.warning("No Chrome process found for session", session_id=session_id)
+            return
+
+        self._idle.put_nowait(chrome_process)
+        logger.debug(
+            "Chrome returned to pool",
+            session_id=session_id,
+            pid=chrome_process.pid,
+            idle=self.idle_count,
+        )
+
+    async def reclaim_idle_port(self) -> int | None:
+        """
+        Terminate one idle pooled Chrome and hand back its DevTools port.
+
+        Used when a session needs a dedicated Chrome (e.g. with a proxy) but
+        every port is held by the warm pool.
+
+        Returns:
+            The freed port, or None if the pool is empty
+        """
+        try:
+            chrome_process = self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+        await self._terminate_process(chrome_process)
+        logger.debug("Reclaimed port from idle Chrome", port=chrome_process.devtools_port)
+        return chrome_process.devtools_port
+
     async def terminate(self, session_id: str) -> None:
         """
         Terminate a Chrome process.
@@ -177,40 +388,58 @@ class ChromeLauncher:
             pid=chrome_process.pid,
         )
 
-        try:
-            # Send SIGTERM
-            os.kill(chrome_process.pid, 15)
+        await self._terminate_process(chrome_process)
 
-            # Wait a bit for graceful shutdown
-            await asyncio.sleep(1)
+    async def _terminate_process(self, chrome_process: ChromeProcess) -> None:
+        """Kill a Chrome process and clean up its user data directory."""
+        process = chrome_process.process
 
-            # Check if still running and force kill if necessary
+        try:
+            # Send SIGTERM and give Chrome a moment to shut down gracefully
+            process.terminate()
             try:
-                os.kill(chrome_process.pid, 0)  # Check if process exists
-                os.kill(chrome_process.pid, 9)  # Force kill
+                await asyncio.wait_for(process.wait(), timeout=1.0)
+            except TimeoutError:
+                process.kill()
+                await process.wait()
                 logger.warning("Chrome required force kill", pid=chrome_process.pid)
-            except ProcessLookupError:
-                pass  # Already terminated
 
         except ProcessLookupError:
             logger.debug("Chrome process already terminated", pid=chrome_process.pid)
         except Exception as e:
             logger.error("Error terminating Chrome", error=str(e))
         finally:
-            # Cleanup user data directory
-            shutil.rmtree(chrome_process.user_data_dir, ignore_errors=True)
+            # Cleanup user data directory off the event loop; a browsed
+            # profile can hold thousands of small files and the unlink storm
+            # would otherwise stall every in-flight session
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(shutil.rmtree, chrome_process.user_data_dir, ignore_errors=True),
+            )
             logger.debug("Cleaned up user data dir", path=chrome_process.user_data_dir)
 
     async def terminate_all(self) -> None:
-        """Terminate all running Chrome processes."""
+        """Terminate all running Chrome processes, including the idle pool."""
         session_ids = list(self._processes.keys())
         for session_id in session_ids:
             await self.terminate(session_id)
 
+        while True:
+            try:
+                chrome_process = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            await self._terminate_process(chrome_process)
+
     def get_process(self, session_id: str) -> ChromeProcess | None:
         """Get Chrome process for a session."""
         return self._processes.get(session_id)
 
+    @property
+    def idle_count(self) -> int:
+        """Number of pre-warmed Chrome processes waiting in the pool."""
+        return self._idle.qsize()
+
 
 # Global Chrome launcher instance
 chrome_launcher = ChromeLauncher()
@@ -8,11 +8,31 @@ from src.browser.cdp import CDPClient
 from src.browser.chrome import ChromeProcess, chrome_launcher
 from src.browser.resource_pool import port_pool
 from src.config import settings
-from src.models import SessionConfig
+from src.models import SessionRuntimeConfig
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Blocked by default: sessions only return HTML, so images, fonts and media
+# are wasted bandwidth and decode CPU
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+    "*.ogg",
+]
+
 
 class BrowserSession:
     """Manages a single browser session with CDP connection."""
@@ -20,13 +40,14 @@ class BrowserSession:
     def __init__(
         self,
         session_id: str,
-        config: SessionConfig,
+        config: SessionRuntimeConfig,
     ) -> None:
         self.session_id = session_id
         self.config = config
         self.chrome_process: ChromeProcess | None = None
         self.cdp_client: CDPClient | None = None
         self._devtools_port: int | None = None
+        self._pooled = False
 
     async def start(self) -> None:
         """Start the browser session."""
@@ -34,29 +55,45 @@ class BrowserSession:
         display = os.environ.get("DISPLAY", ":99")
         display_num = int(display.lstrip(":"))
 
-        # Acquire DevTools port
-        self._devtools_port = await port_pool.acquire()
-        if self._devtools_port is None:
-            raise RuntimeError("No DevTools port available")
+        # Proxy settings are per-process Chrome flags, so proxied sessions
+        # always need a dedicated launch; everything else reuses the warm pool.
+        if self.config.proxy_server is None:
+            self.chrome_process = await chrome_launcher.acquire_pooled(self.session_id)
 
         try:
-            # Launch Chrome
-            self.chrome_process = await chrome_launcher.launch(
-                session_id=self.session_id,
-                display_num=display_num,
-                devtools_port=self._devtools_port,
-                proxy_server=self.config.proxy_server,
-            )
+            if self.chrome_process is not None:
+                self._pooled = True
+                self._devtools_port = self.chrome_process.devtools_port
+            else:
+                # Acquire DevTools port, reclaiming one from the warm pool
+                # if idle Chrome processes hold them all
+                self._devtools_port = await port_pool.acquire()
+                if self._devtools_port is None:
+                    self._devtools_port = await chrome_launcher.reclaim_idle_port()
+                if self._devtools_port is None:
+                    raise RuntimeError("No DevTools port available")
+
+                # Launch Chrome
+                self.chrome_process = await chrome_launcher.launch(
+                    session_id=self.session_id,
+                    display_num=display_num,
+                    devtools_port=self._devtools_port,
+                    proxy_server=self.config.proxy_server,
+                )
 
             # Connect CDP client
             self.cdp_client = CDPClient(self._devtools_port)
             await self.cdp_client.connect()
 
+            # Drop unwanted resource requests before the browser fetches them
+            await self._apply_resource_blocking()
+
             logger.info(
                 "Browser session started",
                 session_id=self.session_id,
                 display=display_num,
                 port=self._devtools_port,
+                pooled=self._pooled,
             )
 
         except Exception as e:
@@ -67,6 +104,11 @@ class BrowserSession:
         """Stop the browser session and release resources."""
         logger.info("Stopping browser session", session_id=self.session_id)
 
+        # Try to hand a clean pooled Chrome back instead of killing it
+        returned_to_pool = False
+        if self._pooled and self.cdp_client:
+            returned_to_pool = await self._reset_for_pool()
+
         # Disconnect CDP
         if self.cdp_client:
             try:
@@ -75,17 +117,73 @@ class BrowserSession:
                 logger.error("Error disconnecting CDP", error=str(e))
             self.cdp_client = None
 
-        # Terminate Chrome
-        await chrome_launcher.terminate(self.session_id)
-        self.chrome_process = None
+        if returned_to_pool:
+            # The process keeps its DevTools port while warm
+            chrome_launcher.release_to_pool(self.session_id)
+        else:
+            # Terminate Chrome and release its port
+            await chrome_launcher.terminate(self.session_id)
+            if self._devtools_port is not None:
+                await port_pool.release(self._devtools_port)
 
-        # Release port
-        if self._devtools_port is not None:
-            await port_pool.release(self._devtools_port)
-            self._devtools_port = None
+        self.chrome_process = None
+        self._devtools_port = None
+        self._pooled = False
 
         logger.info("Browser session stopped", session_id=self.session_id)
 
+    async def _apply_resource_blocking(self) -> None:
+        """Configure Network-level URL blocking for the session."""
+        if not self.cdp_client:
+            return
+
+        patterns = self.config.block_resources
+        if patterns is None:
+            patterns = DEFAULT_BLOCKED_URL_PATTERNS
+        if not patterns:
+            return
+
+        futures = await self.cdp_client.send_many(
+            [("Network.enable", None), ("Network.setBlockedURLs", {"urls": patterns})]
+        )
+        await asyncio.gather(*futures)
+
+        logger.debug(
+            "Resource blocking enabled",
+            session_id=self.session_id,
+            patterns_count=len(patterns),
+        )
+
+    async def _reset_for_pool(self) -> bool:
+        """
+        Reset browser state so the Chrome process can be reused by another session.
+
+        Returns:
+            True if the reset succeeded and the process is safe to pool
+        """
+        if not self.cdp_client:
+            return False
+
+        try:
+            await self.cdp_client.navigate("about:blank")
+            await self.cdp_client.send("Network.clearBrowserCookies")
+            # Cookies alone are not enough: localStorage, IndexedDB and
+            # service workers written by this session would otherwise be
+            # visible to the next one reusing the profile
+            await self.cdp_client.send(
+                "Storage.clearDataForOrigin",
+                {"origin": "*", "storageTypes": "all"},
+                session_id="",
+            )
+            return True
+        except Exception as e:
+            logger.warning(
+                "Failed to reset pooled Chrome, terminating instead",
+                session_id=self.session_id,
+                error=str(e),
+            )
+            return False
+
     async def navigate_and_get_content(self, url: str, delay: int = 0) -> str:
         """
         Navigate to URL and get page content.
@@ -129,6 +227,9 @@ class BrowserManager:
         profile_dir = Path(settings.chrome_user_data_base)
         profile_dir.mkdir(parents=True, exist_ok=True)
 
+        # Pre-warm Chrome processes so sessions skip the cold-start latency
+        await chrome_launcher.prewarm(settings.max_concurrent_sessions)
+
         logger.info(
             "Browser manager initialized",
             max_sessions=settings.max_concurrent_sessions,
@@ -137,7 +238,7 @@ class BrowserManager:
     async def create_session(
         self,
         session_id: str,
-        config: SessionConfig,
+        config: SessionRuntimeConfig,
     ) -> BrowserSession:
         """
         Create and start a new browser session.
@@ -9,7 +9,7 @@ logger = get_logger(__name__)
 
 
 class ResourcePool:
-    """Thread-safe pool for managing limited resources (ports, etc.)."""
+    """Lock-free pool for managing limited resources (ports, etc.)."""
 
     def __init__(self, name: str, start: int, count: int) -> None:
         """
@@ -21,32 +21,41 @@ class ResourcePool:
             count: Number of resources in the pool
         """
         self.name = name
-        self._available: set[int] = set(range(start, start + count))
+        # asyncio.Queue operations are atomic on the event loop, so no lock
+        # is needed, and waiters queue up for free when the pool runs dry
+        self._queue: asyncio.Queue[int] = asyncio.Queue()
         self._in_use: set[int] = set()
-        self._lock = asyncio.Lock()
+        for resource in range(start, start + count):
+            self._queue.put_nowait(resource)
         logger.info(
             f"Initialized {name} pool",
             start=start,
             count=count,
-            available=list(self._available),
         )
 
-    async def acquire(self) -> int | None:
+    async def acquire(self, timeout: float | None = None) -> int | None:
         """
         Acquire a resource from the pool.
 
+        Args:
+            timeout: How long to wait for a resource to free up; None
+                returns immediately when the pool is exhausted.
+
         Returns:
-            The resource value, or None if pool is exhausted.
+            The resource value, or None if none became available.
         """
-        async with self._lock:
-            if not self._available:
-                logger.warning(f"{self.name} pool exhausted")
-                return None
+        try:
+            if timeout is None:
+                resource = self._queue.get_nowait()
+            else:
+                resource = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except (asyncio.QueueEmpty, TimeoutError):
+            logger.warning(f"{self.name} pool exhausted")
+            return None
 
-            resource = self._available.pop()
-            self._in_use.add(resource)
-            logger.debug(f"Acquired {self.name}", value=resource)
-            return resource
+        self._in_use.add(resource)
+        logger.debug(f"Acquired {self.name}", value=resource)
+        return resource
 
     async def release(self, resource: int) -> None:
         """
@@ -55,18 +64,17 @@ class ResourcePool:
         Args:
             resource: The resource value to release.
         """
-        async with self._lock:
-            if resource in self._in_use:
-                self._in_use.remove(resource)
-                self._available.add(resource)
-                logger.debug(f"Released {self.name}", value=resource)
-            else:
-                logger.warning(f"Attempted to release unknown {self.name}", value=resource)
+        if resource in self._in_use:
+            self._in_use.remove(resource)
+            self._queue.put_nowait(resource)
+            logger.debug(f"Released {self.name}", value=resource)
+        else:
+            logger.warning(f"Attempted to release unknown {self.name}", value=resource)
 
     @property
     def available_count(self) -> int:
         """Number of available resources."""
-        return len(self._available)
+        return self._queue.qsize()
 
     @property
     def in_use_count(self) -> int:
@@ -13,7 +13,8 @@ class Settings(BaseSettings):
 
     # Chrome/Chromium settings
     chrome_binary: str = "/usr/bin/chromium"
-    chrome_user_data_base: str = "/tmp/chrome-profiles"
+    # tmpfs on Linux, so profile writes and teardown never hit the block device
+    chrome_user_data_base: str = "/dev/shm/chrome-profiles"
 
     # Display settings (Xvfb)
     display_base: int = 99
@@ -1,17 +1,28 @@
 """Job queue and session orchestration."""
 
 import asyncio
-import uuid
-from datetime import datetime
+import secrets
+from datetime import UTC, datetime
+from typing import cast
 
 from src.config import settings
 from src.jobs.store import job_store, session_store
 from src.jobs.worker import SessionWorker
-from src.models import Job, JobStatus, PageJob, Session, SessionConfig, SessionStatus
+from src.models import (
+    Job,
+    JobStatus,
+    Session,
+    SessionConfig,
+    SessionRuntimeConfig,
+    SessionStatus,
+)
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Sentinel queued on stop() to wake the processor without polling
+_SHUTDOWN = object()
+
 
 class JobQueue:
     """
@@ -22,11 +33,20 @@ class JobQueue:
     """
 
     def __init__(self) -> None:
+        # Settings are immutable after startup; cache the hot read so the
+        # processing loop avoids pydantic-settings attribute lookups
+        self._max_concurrent = settings.max_concurrent_sessions
         self._running = False
-        self._session_queue: asyncio.Queue[Session] = asyncio.Queue()
-        self._active_workers: dict[str, asyncio.Task[None]] = {}
+        self._session_queue: asyncio.Queue[Session | object] = asyncio.Queue()
+        # Worker tasks live in a TaskGroup; _active_count is the only
+        # per-session bookkeeping needed
+        self._worker_group: asyncio.TaskGroup | None = None
         self._processor_task: asyncio.Task[None] | None = None
-        self._semaphore = asyncio.Semaphore(settings.max_concurrent_sessions)
+        # Concurrency gate: only the processor task ever waits, so a counter
+        # plus an Event is enough — no Semaphore waiter-queue bookkeeping
+        self._active_count = 0
+        self._slot_available = asyncio.Event()
+        self._slot_available.set()
 
     async def start(self) -> None:
         """Start the job queue processor."""
@@ -34,30 +54,30 @@ class JobQueue:
             return
 
         self._running = True
+        self._worker_group = asyncio.TaskGroup()
+        await self._worker_group.__aenter__()
         self._processor_task = asyncio.create_task(self._process_sessions())
         logger.info(
             "Job queue started",
-            max_concurrent=settings.max_concurrent_sessions,
+            max_concurrent=self._max_concurrent,
         )
 
     async def stop(self) -> None:
         """Stop the job queue processor."""
         self._running = False
 
-        # Cancel processor task
+        # Wake the processor with a sentinel so it exits its queue wait
         if self._processor_task:
-            self._processor_task.cancel()
-            try:
-                await self._processor_task
-            except asyncio.CancelledError:
-                pass
+            await self._session_queue.put(_SHUTDOWN)
+            await self._processor_task
             self._processor_task = None
 
         # Wait for active workers to complete
-        if self._active_workers:
-            logger.info("Waiting for active workers to complete...")
-            await asyncio.gather(*self._active_workers.values(), return_exceptions=True)
-            self._active_workers.clear()
+        if self._worker_group is not None:
+            if self._active_count:
+                logger.info("Waiting for active workers to complete...")
+            await self._worker_group.__aexit__(None, None, None)
+            self._worker_group = None
 
         logger.info("Job queue stopped")
 
@@ -76,34 +96,43 @@ class JobQueue:
         Returns:
             Created Session with job IDs
         """
-        session_id = str(uuid.uuid4())
-        now = datetime.utcnow()
+        session_id = secrets.token_hex(16)
+        now = datetime.now(UTC)
 
-        # Create jobs for each page
-        page_jobs: list[PageJob] = []
+        # Create jobs for each page. Inputs are already validated at the API
+        # boundary, so model_construct skips pydantic's validation pipeline.
+        page_jobs: list[tuple[str, str]] = []
+        jobs: list[Job] = []
         for url in pages:
-            job_id = str(uuid.uuid4())
-
-            job = Job(
-                id=job_id,
-                session_id=session_id,
-                url=url,
-                status=JobStatus.QUEUED,
-                queued_at=now,
+            job_id = secrets.token_hex(16)
+
+            jobs.append(
+                Job.model_construct(
+                    id=job_id,
+                    session_id=session_id,
+                    url=url,
+                    status=JobStatus.QUEUED,
+                    queued_at=now,
+                )
             )
-            await job_store.add(job)
+            page_jobs.append((url, job_id))
 
-            page_jobs.append(PageJob(url=url, id=job_id))
+        job_store.add_many(jobs)
 
-        # Create session
-        session = Session(
+        # Create session; config moves to its slotted runtime mirror since
+        # the worker reads it far more often than the API serializes it
+        session = Session.model_construct(
             id=session_id,
             status=SessionStatus.CREATED,
-            config=config,
+            config=SessionRuntimeConfig(
+                delay_between_requests=config.delay_between_requests,
+                proxy_server=config.proxy_server,
+                block_resources=config.block_resources,
+            ),
             pages=page_jobs,
             created_at=now,
         )
-        await session_store.add(session)
+        session_store.add(session)
 
         # Queue session for processing
         await self._session_queue.put(session)
@@ -121,27 +150,28 @@ class JobQueue:
         """Background task that processes queued sessions."""
         while self._running:
             try:
-                # Get next session (with timeout to check _running flag)
-                try:
-                    session = await asyncio.wait_for(
-                        self._session_queue.get(),
-                        timeout=1.0,
-                    )
-                except TimeoutError:
-                    continue
-
-                # Acquire semaphore slot (limits concurrency)
-                await self._semaphore.acquire()
+                # Block on the queue directly; stop() wakes us with a sentinel
+                item = await self._session_queue.get()
+                if item is _SHUTDOWN:
+                    break
+                session = cast(Session, item)
+
+                # Wait for a free slot (limits concurrency)
+                while self._active_count >= self._max_concurrent:
+                    self._slot_available.clear()
+                    await self._slot_available.wait()
+                self._active_count += 1
 
                 # Start worker for this session
                 worker = SessionWorker(session)
-                task = asyncio.create_task(self._run_worker_with_cleanup(session.id, worker))
-                self._active_workers[session.id] = task
+                self._worker_group.create_task(  # type: ignore[union-attr]
+                    self._run_worker_with_cleanup(session.id, worker)
+                )
 
                 logger.debug(
                     "Session worker started",
                     session_id=session.id,
-                    active_workers=len(self._active_workers),
+                    active_workers=self._active_count,
                 )
 
             except asyncio.CancelledError:
@@ -160,16 +190,14 @@ class JobQueue:
         except Exception as e:
             logger.error("Worker error", session_id=session_id, error=str(e))
         finally:
-            # Release semaphore slot
-            self._semaphore.release()
-
-            # Remove from active workers
-            self._active_workers.pop(session_id, None)
+            # Release the concurrency slot and wake the processor if waiting
+            self._active_count -= 1
+            self._slot_available.set()
 
             logger.debug(
                 "Session worker finished",
                 session_id=session_id,
-                active_workers=len(self._active_workers),
+                active_workers=self._active_count,
             )
 
     def get_job(self, job_id: str) -> Job | None:
@@ -188,7 +216,7 @@ class JobQueue:
     @property
     def active_sessions(self) -> int:
         """Number of sessions currently being processed."""
-        return len(self._active_workers)
+        return self._active_count
 
 
 # Global job queue instance
@@ -1,6 +1,7 @@
 """In-memory job and session storage."""
 
-import asyncio
+import logging
+from collections import OrderedDict
 from collections.abc import Iterator
 
 from src.models import Job, Session, SessionStatus
@@ -8,34 +9,82 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Level checks go through the stdlib logger directly: it works whether or
+# not structlog has been configured yet, and the call is a cheap C-level
+# comparison
+_stdlib_logger = logging.getLogger(__name__)
+_DEBUG = logging.DEBUG
+
+# All access happens on the event loop thread, where single dict operations
+# are atomic between awaits, so the stores need no locking at all.
+
+# Caps on retained history; oldest entries are evicted first so the stores
+# cannot grow without bound on a long-running service
+_MAX_JOBS = 50_000
+_MAX_SESSIONS = 10_000
+
 
 class JobStore:
-    """Thread-safe in-memory store for jobs."""
+    """In-memory store for jobs."""
 
     def __init__(self) -> None:
-        self._jobs: dict[str, Job] = {}
-        self._lock = asyncio.Lock()
+        # Insertion-ordered so the oldest jobs can be evicted when full
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        # Secondary index so per-session lookups don't scan every job;
+        # buckets keep insertion (i.e. queued) order
+        self._by_session: dict[str, list[Job]] = {}
 
-    async def add(self, job: Job) -> None:
+    def add(self, job: Job) -> None:
         """Add a job to the store."""
-        async with self._lock:
-            self._jobs[job.id] = job
+        self._jobs[job.id] = job
+        self._by_session.setdefault(job.session_id, []).append(job)
+        self._evict_oldest()
+        # Cheap level check: skips the whole processor chain per job write
+        # when debug logging is off
+        if _stdlib_logger.isEnabledFor(_DEBUG):
             logger.debug("Job added to store", job_id=job.id)
 
+    def add_many(self, jobs: list[Job]) -> None:
+        """Add a batch of jobs in one pass with a single aggregate log."""
+        self._jobs.update((job.id, job) for job in jobs)
+        for job in jobs:
+            self._by_session.setdefault(job.session_id, []).append(job)
+        self._evict_oldest()
+        if _stdlib_logger.isEnabledFor(_DEBUG):
+            logger.debug("Jobs added to store", count=len(jobs))
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest jobs while over the retention cap."""
+        while len(self._jobs) > _MAX_JOBS:
+            _, job = self._jobs.popitem(last=False)
+            bucket = self._by_session.get(job.session_id)
+            if bucket is not None:
+                try:
+                    bucket.remove(job)
+                except ValueError:
+                    pass
+                if not bucket:
+                    del self._by_session[job.session_id]
+
     def get(self, job_id: str) -> Job | None:
-        """Get a job by ID (no lock needed for read)."""
+        """Get a job by ID."""
         return self._jobs.get(job_id)
 
-    async def update(self, job: Job) -> None:
+    def update(self, job: Job) -> None:
         """Update an existing job."""
-        async with self._lock:
-            if job.id in self._jobs:
-                self._jobs[job.id] = job
+        if job.id in self._jobs:
+            self._jobs[job.id] = job
+            if _stdlib_logger.isEnabledFor(_DEBUG):
                 logger.debug("Job updated", job_id=job.id, status=job.status)
 
     def get_by_session(self, session_id: str) -> list[Job]:
-        """Get all jobs for a session."""
-        return [job for job in self._jobs.values() if job.session_id == session_id]
+        """Get all jobs for a session, in queued order."""
+        return list(self._by_session.get(session_id, ()))
+
+    def remove_session(self, session_id: str) -> None:
+        """Remove all jobs belonging to a session."""
+        for job in self._by_session.pop(session_id, ()):
+            self._jobs.pop(job.id, None)
 
     def get_all(self) -> list[Job]:
         """Get all jobs."""
@@ -48,33 +97,45 @@ class JobStore:
 
 
 class SessionStore:
-    """Thread-safe in-memory store for sessions."""
+    """In-memory store for sessions."""
 
     def __init__(self) -> None:
-        self._sessions: dict[str, Session] = {}
-        self._lock = asyncio.Lock()
+        # Insertion-ordered so the oldest sessions can be evicted when full
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        # IDs of sessions still in CREATED status, so get_pending doesn't
+        # scan the whole store
+        self._pending: set[str] = set()
 
-    async def add(self, session: Session) -> None:
+    def add(self, session: Session) -> None:
         """Add a session to the store."""
-        async with self._lock:
-            self._sessions[session.id] = session
+        self._sessions[session.id] = session
+        if session.status == SessionStatus.CREATED:
+            self._pending.add(session.id)
+        while len(self._sessions) > _MAX_SESSIONS:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            self._pending.discard(evicted_id)
+        if _stdlib_logger.isEnabledFor(_DEBUG):
             logger.debug("Session added to store", session_id=session.id)
 
     def get(self, session_id: str) -> Session | None:
         """Get a session by ID."""
         return self._sessions.get(session_id)
 
-    async def update(self, session: Session) -> None:
+    def update(self, session: Session) -> None:
         """Update an existing session."""
-        async with self._lock:
-            if session.id in self._sessions:
-                self._sessions[session.id] = session
+        if session.id in self._sessions:
+            self._sessions[session.id] = session
+            if session.status == SessionStatus.CREATED:
+                self._pending.add(session.id)
+            else:
+                self._pending.discard(session.id)
+            if _stdlib_logger.isEnabledFor(_DEBUG):
                 logger.debug("Session updated", session_id=session.id, status=session.status)
 
-    async def remove(self, session_id: str) -> Session | None:
+    def remove(self, session_id: str) -> Session | None:
         """Remove a session from the store."""
-        async with self._lock:
-            return self._sessions.pop(session_id, None)
+        self._pending.discard(session_id)
+        return self._sessions.pop(session_id, None)
 
     def get_all(self) -> list[Session]:
         """Get all sessions."""
@@ -82,9 +143,8 @@ class SessionStore:
 
     def get_pending(self) -> Iterator[Session]:
         """Get sessions waiting to be processed."""
-        for session in self._sessions.values():
-            if session.status == SessionStatus.CREATED:
-                yield session
+        for session_id in self._pending:
+            yield self._sessions[session_id]
 
     @property
     def count(self) -> int:
@@ -1,7 +1,7 @@
 """Session worker that processes jobs within a browser session."""
 
 import asyncio
-from datetime import datetime
+from datetime import UTC, datetime
 
 from src.browser.manager import BrowserSession, browser_manager
 from src.jobs.store import job_store, session_store
@@ -35,8 +35,8 @@ class SessionWorker:
 
         # Update session status
         self.session.status = SessionStatus.RUNNING
-        self.session.started_at = datetime.utcnow()
-        await session_store.update(self.session)
+        self.session.started_at = datetime.now(UTC)
+        session_store.update(self.session)
 
         try:
             # Start browser session
@@ -45,23 +45,28 @@ class SessionWorker:
                 config=self.session.config,
             )
 
-            # Process each job
-            jobs = job_store.get_by_session(self.session.id)
-            jobs.sort(key=lambda j: j.queued_at)  # Process in order
+            # The session already holds its job ids in creation order, so
+            # fetch each job directly instead of going through the store index
+            jobs = [
+                job
+                for _url, job_id in self.session.pages
+                if (job := job_store.get(job_id)) is not None
+            ]
 
+            delay = self.session.config.delay_between_requests
+            last = len(jobs) - 1
             for i, job in enumerate(jobs):
                 await self._process_job(job)
 
                 # Apply delay between requests (except after last job)
-                if i < len(jobs) - 1 and self.session.config.delay_between_requests > 0:
-                    delay = self.session.config.delay_between_requests
+                if delay > 0 and i < last:
                     logger.debug("Applying delay between jobs", delay=delay)
                     await asyncio.sleep(delay)
 
             # Mark session as completed
             self.session.status = SessionStatus.COMPLETED
-            self.session.completed_at = datetime.utcnow()
-            await session_store.update(self.session)
+            self.session.completed_at = datetime.now(UTC)
+            session_store.update(self.session)
 
             logger.info("Session completed", session_id=self.session.id)
 
@@ -72,14 +77,15 @@ class SessionWorker:
                 error=str(e),
             )
             self.session.status = SessionStatus.FAILED
-            self.session.completed_at = datetime.utcnow()
-            await session_store.update(self.session)
+            self.session.completed_at = datetime.now(UTC)
+            session_store.update(self.session)
 
             # Mark remaining jobs as failed
-            for job in job_store.get_by_session(self.session.id):
-                if job.status in (JobStatus.QUEUED, JobStatus.IN_PROGRESS):
+            for _url, job_id in self.session.pages:
+                job = job_store.get(job_id)
+                if job is not None and job.status in (JobStatus.QUEUED, JobStatus.IN_PROGRESS):
                     job.mark_failed(f"Session failed: {str(e)}")
-                    await job_store.update(job)
+                    job_store.update(job)
 
         finally:
             # Cleanup browser session
@@ -97,34 +103,33 @@ class SessionWorker:
 
         # Mark job as started
         job.mark_started()
-        await job_store.update(job)
+        job_store.update(job)
 
         try:
             if not self._browser_session:
                 raise RuntimeError("Browser session not available")
 
-            # Navigate and get content
-            content = await self._browser_session.navigate_and_get_content(
-                url=job.url,
-                delay=self.session.config.delay_between_requests,
-            )
+            # Navigate and get content; the between-jobs pause in run() is
+            # the single place the configured delay applies
+            content = await self._browser_session.navigate_and_get_content(url=job.url)
 
-            # Mark job as completed
-            result = JobResult(
+            # Mark job as completed; model_construct keeps the (potentially
+            # large) content string out of pydantic's validation pass
+            content_length = len(content)
+            result = JobResult.model_construct(
                 url=job.url,
                 content=content,
-                metadata={
-                    "content_length": len(content),
-                },
+                error=None,
+                metadata={"content_length": content_length},
             )
             job.mark_completed(result)
-            await job_store.update(job)
+            job_store.update(job)
 
             logger.info(
                 "Job completed",
                 job_id=job.id,
                 execution_time_ms=job.execution_time_ms,
-                content_length=len(content),
+                content_length=content_length,
             )
 
         except Exception as e:
@@ -134,4 +139,4 @@ class SessionWorker:
                 error=str(e),
             )
             job.mark_failed(str(e))
-            await job_store.update(job)
+            job_store.update(job)
@@ -8,6 +8,7 @@ from src.models.session import (
     Session,
     SessionConfig,
     SessionResponse,
+    SessionRuntimeConfig,
     SessionStatus,
 )
 
@@ -22,5 +23,6 @@ __all__ = [
     "Session",
     "SessionConfig",
     "SessionResponse",
+    "SessionRuntimeConfig",
     "SessionStatus",
 ]
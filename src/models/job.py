@@ -1,10 +1,11 @@
 """Job models and types."""
 
-from datetime import datetime
+import time
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class JobStatus(str, Enum):
@@ -38,28 +39,34 @@ class Job(BaseModel):
     execution_time_ms: int | None = None
     result: JobResult | None = None
 
+    # Monotonic start stamp for duration math; wall-clock timestamps stay on
+    # the model because JobResponse serializes them
+    _started_ns: int | None = PrivateAttr(default=None)
+
     def mark_started(self) -> None:
         """Mark the job as started."""
         self.status = JobStatus.IN_PROGRESS
-        self.started_at = datetime.utcnow()
+        self._started_ns = time.monotonic_ns()
+        self.started_at = datetime.now(UTC)
 
     def mark_completed(self, result: JobResult) -> None:
         """Mark the job as completed with result."""
         self.status = JobStatus.COMPLETED
-        self.completed_at = datetime.utcnow()
+        self.completed_at = datetime.now(UTC)
         self.result = result
-        if self.started_at:
-            delta = self.completed_at - self.started_at
-            self.execution_time_ms = int(delta.total_seconds() * 1000)
+        self._record_execution_time()
 
     def mark_failed(self, error: str) -> None:
         """Mark the job as failed with error."""
         self.status = JobStatus.FAILED
-        self.completed_at = datetime.utcnow()
+        self.completed_at = datetime.now(UTC)
         self.result = JobResult(url=self.url, error=error)
-        if self.started_at:
-            delta = self.completed_at - self.started_at
-            self.execution_time_ms = int(delta.total_seconds() * 1000)
+        self._record_execution_time()
+
+    def _record_execution_time(self) -> None:
+        """Compute execution time from the monotonic clock, immune to NTP steps."""
+        if self._started_ns is not None:
+            self.execution_time_ms = (time.monotonic_ns() - self._started_ns) // 1_000_000
 
 
 class JobResponse(BaseModel):
@@ -1,5 +1,6 @@
 """Browser session models."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
@@ -24,6 +25,27 @@ class SessionConfig(BaseModel):
     proxy_server: str | None = Field(
         default=None, description="Proxy server URL (e.g., http://proxy:8080)"
     )
+    block_resources: list[str] | None = Field(
+        default=None,
+        description=(
+            "URL patterns to block before they are fetched "
+            "(None applies the default image/font/media list, [] disables blocking)"
+        ),
+    )
+
+
+@dataclass(slots=True)
+class SessionRuntimeConfig:
+    """Slotted mirror of :class:`SessionConfig` for the worker hot path.
+
+    Validation happens once on the API request model; internally the same
+    three fields are read many times per session, where a slots dataclass is
+    smaller and faster than a pydantic model.
+    """
+
+    delay_between_requests: int = 0
+    proxy_server: str | None = None
+    block_resources: list[str] | None = None
 
 
 class PageJob(BaseModel):
@@ -34,12 +56,17 @@ class PageJob(BaseModel):
 
 
 class Session(BaseModel):
-    """Represents a browser session."""
+    """Represents a browser session.
+
+    ``pages`` holds plain ``(url, job_id)`` tuples rather than ``PageJob``
+    instances; workers only ever read the two strings, so the per-page model
+    allocation is saved and conversion happens at the API boundary.
+    """
 
     id: str
     status: SessionStatus = SessionStatus.CREATED
-    config: SessionConfig
-    pages: list[PageJob] = Field(default_factory=list)
+    config: SessionRuntimeConfig
+    pages: list[tuple[str, str]] = Field(default_factory=list)
     created_at: datetime
     started_at: datetime | None = None
     completed_at: datetime | None = None
@@ -73,3 +100,10 @@ class ContentResponse(BaseModel):
     id: str
     status: SessionStatus
     pages: list[PageJob]
+    error: str | None = Field(
+        default=None,
+        description=(
+            "Set when this entry failed to create (id is then empty); "
+            "other entries in the batch are unaffected"
+        ),
+    )
@@ -3,7 +3,7 @@
 import uuid
 from datetime import UTC, datetime
 
-from src.models import Job, JobStatus, Session, SessionConfig, SessionStatus
+from src.models import Job, JobStatus, Session, SessionConfig, SessionRuntimeConfig, SessionStatus
 from src.models.session import PageJob
 
 
@@ -26,7 +26,7 @@ def test_session_creation() -> None:
     """Test basic session creation."""
     session = Session(
         id=str(uuid.uuid4()),
-        config=SessionConfig(),
+        config=SessionRuntimeConfig(),
         created_at=datetime.now(UTC),
     )
 
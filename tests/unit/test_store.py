@@ -0,0 +1,60 @@
+"""Tests for in-memory job storage."""
+
+import uuid
+from datetime import UTC, datetime
+
+from src.jobs.store import JobStore
+from src.models import Job
+
+
+def _make_job(session_id: str) -> Job:
+    return Job(
+        id=str(uuid.uuid4()),
+        session_id=session_id,
+        url="https://example.com",
+        queued_at=datetime.now(UTC),
+    )
+
+
+def test_get_by_session_returns_jobs_in_queued_order() -> None:
+    """Jobs come back in the order they were added."""
+    store = JobStore()
+    jobs = [_make_job("session-1") for _ in range(3)]
+    for job in jobs:
+        store.add(job)
+    store.add(_make_job("session-2"))
+
+    assert store.get_by_session("session-1") == jobs
+
+
+def test_get_by_session_unknown_session() -> None:
+    """Unknown sessions yield an empty list."""
+    store = JobStore()
+
+    assert store.get_by_session("missing") == []
+
+
+def test_oldest_jobs_evicted_over_cap(monkeypatch) -> None:
+    """The store drops its oldest jobs once the retention cap is exceeded."""
+    monkeypatch.setattr("src.jobs.store._MAX_JOBS", 2)
+    store = JobStore()
+    old, newer, newest = (_make_job("session-1") for _ in range(3))
+    for job in (old, newer, newest):
+        store.add(job)
+
+    assert store.get(old.id) is None
+    assert store.get_by_session("session-1") == [newer, newest]
+    assert store.count == 2
+
+
+def test_remove_session_drops_jobs() -> None:
+    """Removing a session clears its jobs from both indexes."""
+    store = JobStore()
+    job = _make_job("session-1")
+    store.add(job)
+
+    store.remove_session("session-1")
+
+    assert store.get(job.id) is None
+    assert store.get_by_session("session-1") == []
+    assert store.count == 0